@@ -2,14 +2,19 @@
 New CLI interface with dynamic plugin options
 """
 
+import copy
+import functools
+import io
 import os
+import re
+import stat
 import subprocess
 import sys
+import tempfile
 from pathlib import Path
-from typing import Optional, List, Tuple
+from typing import Callable, Optional, List, Tuple
 
 import click
-from jinja2 import Environment, PackageLoader
 
 from .generator import JuliaPackageGenerator, PackageConfig, JuliaDependencyError
 
@@ -31,6 +36,77 @@ ARGUMENTLESS_PLUGINS = {
     "Develop",
 }
 
+# Plugins whose bare [default] key (table or `Plugin = true`) carries plugin config
+_CONFIG_PLUGIN_SECTIONS = (
+    frozenset(
+        {
+            "Formatter",
+            "Git",
+            "Tests",
+            "ProjectFile",
+            "Documenter",
+            "TagBot",
+            "CompatHelper",
+            "Codecov",
+            "GitHubActions",
+        }
+    )
+    | ARGUMENTLESS_PLUGINS
+)
+
+# CLI option name for each PkgTemplates.jl plugin; unknown plugins fall back to
+# the lowercased name
+_PLUGIN_OPTION_NAMES = {
+    # Core plugins
+    "Git": "--git",
+    "Tests": "--tests",
+    "Formatter": "--formatter",
+    "ProjectFile": "--projectfile",
+    "SrcDir": "--srcdir",
+    "Readme": "--readme",
+    # CI/CD plugins
+    "GitHubActions": "--githubactions",
+    "AppVeyor": "--appveyor",
+    "CirrusCI": "--cirrusci",
+    "DroneCI": "--droneci",
+    "GitLabCI": "--gitlabci",
+    "TravisCI": "--travisci",
+    # Code coverage plugins
+    "Codecov": "--codecov",
+    "Coveralls": "--coveralls",
+    # Documentation plugins
+    "Documenter": "--documenter",
+    # Automation plugins
+    "TagBot": "--tagbot",
+    "CompatHelper": "--compathelper",
+    "Dependabot": "--dependabot",
+    # Badge plugins
+    "BlueStyleBadge": "--bluestylebadge",
+    "ColPracBadge": "--colpracbadge",
+    "PkgEvalBadge": "--pkgevalbadge",
+    # Miscellaneous plugins
+    "Develop": "--develop",
+    "Citation": "--citation",
+    "RegisterAction": "--registeraction",
+    "CodeOwners": "--codeowners",
+    "PkgBenchmark": "--pkgbenchmark",
+    "Runic": "--runic",
+    "License": "--license",
+}
+
+# Reverse lookup from Click parameter name to plugin; License has its own parser
+_OPTION_TO_PLUGIN = {
+    option[2:]: plugin
+    for plugin, option in _PLUGIN_OPTION_NAMES.items()
+    if plugin != "License"
+}
+
+# Julia package names: a leading letter followed by letters, digits, hyphens or underscores
+_PACKAGE_NAME_RE = re.compile(r"[A-Za-z][A-Za-z0-9_-]*")
+# Allowed characters only, with at least one letter or digit (names made of just
+# hyphens/underscores report the character rule, not the leading-letter rule)
+_PACKAGE_NAME_CHARS_RE = re.compile(r"[_-]*[A-Za-z0-9][A-Za-z0-9_-]*")
+
 
 def check_julia_dependencies():
     """Check Julia dependencies early and exit if not available"""
@@ -53,6 +129,20 @@ def set_config_file(file_path: Optional[str]) -> None:
         _custom_config_file = Path(file_path).expanduser().resolve()
     else:
         _custom_config_file = None
+    # Help defaults are read from the active config file
+    _get_help_defaults.cache_clear()
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_xdg_config_file_path(xdg_config_home: Optional[str]) -> Path:
+    """Resolve XDG config file path once per XDG_CONFIG_HOME value"""
+    if xdg_config_home:
+        config_dir = Path(xdg_config_home)
+    else:
+        config_dir = Path.home() / ".config"
+
+    # Directory is created by save_config, the only writer, so reads stay side-effect free
+    return config_dir / "jtc" / "config.toml"
 
 
 def get_config_file_path() -> Path:
@@ -62,44 +152,79 @@ def get_config_file_path() -> Path:
     if _custom_config_file:
         return _custom_config_file
 
-    xdg_config_home = os.environ.get("XDG_CONFIG_HOME")
-    if xdg_config_home:
-        config_dir = Path(xdg_config_home)
-    else:
-        config_dir = Path.home() / ".config"
+    # Keyed on the environment value so a changed XDG_CONFIG_HOME is still honored
+    return _resolve_xdg_config_file_path(os.environ.get("XDG_CONFIG_HOME"))
 
-    app_config_dir = config_dir / "jtc"
-    app_config_dir.mkdir(parents=True, exist_ok=True)
-    return app_config_dir / "config.toml"
+
+# TOML modules are resolved on first use so commands that never touch the
+# config file skip their import entirely
+_toml_reader = None
+_toml_writer = None
+
+
+def _get_toml_reader():
+    """Return the tomllib module, importing it once"""
+    global _toml_reader
+    if _toml_reader is None:
+        import tomllib
+
+        _toml_reader = tomllib
+    return _toml_reader
+
+
+def _get_toml_writer():
+    """Return the tomli_w module, importing it once"""
+    global _toml_writer
+    if _toml_writer is None:
+        import tomli_w
+
+        _toml_writer = tomli_w
+    return _toml_writer
+
+
+@functools.lru_cache(maxsize=4)
+def _load_config_cached(config_path: Path, mtime_ns: int, size: int) -> dict:
+    """Parse config.toml once per file version (path, mtime and size)"""
+    config = {}
+
+    try:
+        with open(config_path, "rb") as f:
+            config = _get_toml_reader().load(f)
+    except Exception as e:
+        click.echo(f"Warning: Error loading config file {config_path}: {e}", err=True)
+
+    return config
 
 
 def load_config() -> dict:
     """Load configuration from config.toml"""
     config_path = get_config_file_path()
-    config = {}
 
-    if config_path.exists():
-        try:
-            import tomllib
-
-            with open(config_path, "rb") as f:
-                config = tomllib.load(f)
-        except Exception as e:
-            click.echo(
-                f"Warning: Error loading config file {config_path}: {e}", err=True
-            )
+    try:
+        stat_result = config_path.stat()
+    except OSError:
+        return {}
+    # Behaves like Path.is_file(): a directory at the config path means "no config"
+    if not stat.S_ISREG(stat_result.st_mode):
+        return {}
 
-    return config
+    config = _load_config_cached(
+        config_path, stat_result.st_mtime_ns, stat_result.st_size
+    )
+    # Callers mutate the returned dict, so never hand out the cached instance
+    return copy.deepcopy(config)
 
 
 def flatten_config_for_backward_compatibility(config: dict) -> dict:
     """Convert nested config structure to flat dot-notation for backward compatibility"""
-    if "default" not in config:
+    defaults = config.get("default")
+    # Already flat (no plugin tables): nothing to rewrite
+    if defaults is None or not any(isinstance(v, dict) for v in defaults.values()):
         return config
 
-    defaults = config["default"].copy()
     flattened_defaults = {}
 
+    # Read-only walk, so the source table needs no defensive copy
     for key, value in defaults.items():
         if isinstance(value, dict):
             for plugin_key, plugin_value in value.items():
@@ -110,6 +235,45 @@ def flatten_config_for_backward_compatibility(config: dict) -> dict:
     return {"default": flattened_defaults}
 
 
+def load_defaults() -> dict:
+    """Load the [default] table in flat dot-notation, as create and help text use it"""
+    # Not memoized itself: load_config already caches the parse per file version
+    config = load_config()
+    flat_config = flatten_config_for_backward_compatibility(config)
+    return flat_config.get("default", {})
+
+
+def _replace_file_atomically(path: Path, data: bytes) -> None:
+    """Write data to a sibling temp file and rename it over path"""
+    # Follow symlinks so a linked config (e.g. into a dotfiles repo) is updated
+    # in place rather than replaced by a regular file
+    path = path.resolve()
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = None
+    # mkstemp creates a uniquely named 0600 file, so concurrent saves never share a
+    # temp file and the config is never readable more widely than its target
+    fd, tmp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    tmp_path = Path(tmp_name)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            # Keep the existing file's permissions, applied before any data is written
+            if mode is not None:
+                os.chmod(tmp_path, mode)
+            f.write(data)
+            f.flush()
+            # Make the data durable before the rename publishes it
+            os.fsync(f.fileno())
+        # os.replace is atomic, so an interrupted save never leaves a truncated config
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 def save_config(config: dict) -> None:
     """Save configuration to config.toml"""
     config_path = get_config_file_path()
@@ -118,65 +282,33 @@ def save_config(config: dict) -> None:
     config_path.parent.mkdir(parents=True, exist_ok=True)
 
     try:
-        import tomli_w
-
-        with open(config_path, "wb") as f:
-            tomli_w.dump(config, f)
-    except ImportError:
-        # Manual TOML generation when tomli_w is unavailable
-        content = ""
-        defaults = config.get("default", {})
-
-        basic_values = {}
-        plugin_values = {}
-
-        for key, value in defaults.items():
-            if "." in key:
-                plugin_name, option_name = key.split(".", 1)
-                if plugin_name not in plugin_values:
-                    plugin_values[plugin_name] = {}
-                plugin_values[plugin_name][option_name] = value
-            else:
-                basic_values[key] = value
-
-        if basic_values or plugin_values:
-            content += "[default]\n"
-            for key, value in basic_values.items():
-                if isinstance(value, str):
-                    content += f'{key} = "{value}"\n'
-                elif isinstance(value, bool):
-                    content += f"{key} = {str(value).lower()}\n"
-                elif isinstance(value, (int, float)):
-                    content += f"{key} = {value}\n"
-                elif isinstance(value, list):
-                    content += f"{key} = {value}\n"
-
-            for plugin_name, options in plugin_values.items():
-                content += f"\n[default.{plugin_name}]\n"
-                for option_key, option_value in options.items():
-                    if isinstance(option_value, str):
-                        content += f'{option_key} = "{option_value}"\n'
-                    elif isinstance(option_value, bool):
-                        content += f"{option_key} = {str(option_value).lower()}\n"
-                    elif isinstance(option_value, (int, float)):
-                        content += f"{option_key} = {option_value}\n"
-                    elif isinstance(option_value, list):
-                        content += f"{option_key} = {option_value}\n"
-
-        with open(config_path, "w") as f:
-            f.write(content)
+        # tomli_w is a declared dependency; a missing install fails loudly below
+        buffer = io.BytesIO()
+        _get_toml_writer().dump(config, buffer)
+        _replace_file_atomically(config_path, buffer.getvalue())
     except Exception as e:
         click.echo(f"Error saving configuration: {e}", err=True)
         sys.exit(1)
+    finally:
+        # mtime granularity may hide a rewrite within the same tick
+        _load_config_cached.cache_clear()
+        _get_help_defaults.cache_clear()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_help_defaults() -> dict:
+    """Read config defaults once and share them across all help-text helpers
+
+    Cleared by set_config_file and save_config so help follows the active config.
+    """
+    return load_defaults()
 
 
 def get_help_with_default(
     description: str, config_key: str, fallback_default: str
 ) -> str:
     """Generate help text with actual default value from config"""
-    config = load_config()
-    flat_config = flatten_config_for_backward_compatibility(config)
-    defaults = flat_config.get("default", {})
+    defaults = _get_help_defaults()
     actual_default = defaults.get(config_key, fallback_default)
     return f"{description} (default: {actual_default})"
 
@@ -185,9 +317,7 @@ def get_help_with_fallback(
     base_description: str, config_key: str, fallback_text: Optional[str] = None
 ) -> str:
     """Generate help text with config default or fallback text"""
-    config = load_config()
-    flat_config = flatten_config_for_backward_compatibility(config)
-    defaults = flat_config.get("default", {})
+    defaults = _get_help_defaults()
     value = defaults.get(config_key)
 
     if value and value.strip():
@@ -225,12 +355,63 @@ def get_mail_help() -> str:
     )
 
 
+# Built-in fallbacks for plain create options missing from both CLI and config file
+_CREATE_FALLBACKS = (
+    ("user", None),
+    ("mail", None),
+    ("output_dir", "."),
+    ("julia_version", None),
+    ("mise_filename_base", ".mise"),
+)
+
+
+def resolve_option_defaults(defaults: dict, **cli_values) -> dict:
+    """Resolve plain options with CLI > config file > built-in fallback precedence"""
+    return {
+        key: cli_values.get(key) or defaults.get(key, fallback)
+        for key, fallback in _CREATE_FALLBACKS
+    }
+
+
+class LazyHelpOption(click.Option):
+    """Click option whose help text is built only when help is actually rendered"""
+
+    def __init__(
+        self,
+        *args,
+        help_factory: Optional[Callable[[], str]] = None,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        # Defer config-dependent help so non-help invocations never read the config for it
+        self.help_factory = help_factory
+
+    def get_help_record(self, ctx: click.Context) -> Optional[Tuple[str, str]]:
+        if self.help is not None or self.help_factory is None:
+            return super().get_help_record(ctx)
+        # Render from a per-call copy so the text follows the active config on
+        # every render; _get_help_defaults already caches the config read
+        option = copy.copy(self)
+        option.help = self.help_factory()
+        return click.Option.get_help_record(option, ctx)
+
+
+# Case-insensitive spellings accepted for boolean plugin option values
+_BOOL_LITERALS = {
+    "true": True,
+    "yes": True,
+    "1": True,
+    "false": False,
+    "no": False,
+    "0": False,
+}
+
+
 def parse_plugin_option_value(value_str: str):
     """Convert string values to appropriate Python types for Julia interop"""
-    if value_str.lower() in ("true", "yes", "1"):
-        return True
-    elif value_str.lower() in ("false", "no", "0"):
-        return False
+    boolean = _BOOL_LITERALS.get(value_str.lower())
+    if boolean is not None:
+        return boolean
     elif value_str.startswith("[") and value_str.endswith("]"):
         content = value_str[1:-1].strip()
         if not content:
@@ -259,67 +440,71 @@ def ensure_list(value):
     return [value]
 
 
-def parse_multiple_key_value_pairs(option_string: str) -> dict:
-    """Extract configuration options from space-separated key=value format with merge support"""
-    options = {}
-    merge_options = {}
-    if not option_string:
-        return {"options": options, "merge_metadata": merge_options}
+def _split_option_tokens(option_string: str) -> List[str]:
+    """Split a plugin option string on spaces outside quotes and brackets"""
+    if (
+        '"' not in option_string
+        and "'" not in option_string
+        and "[" not in option_string
+    ):
+        # Fast path: without quotes or arrays every space separates options
+        return [part.strip() for part in option_string.split(" ") if part.strip()]
 
-    # Parse quoted strings and arrays to preserve spaces in option values
+    # Parse quoted strings and arrays to preserve spaces in option values.
+    # Tokens are sliced out of the input at each separating space rather
+    # than rebuilt one character at a time.
     parts = []
-    current_part = ""
+    start = 0
     in_quotes = False
     quote_char = None
-    in_array = False
     bracket_depth = 0
 
-    for char in option_string:
-        if char == "[" and not in_quotes:
-            in_array = True
+    for index, char in enumerate(option_string):
+        if in_quotes:
+            if char == quote_char:
+                in_quotes = False
+                quote_char = None
+        elif char == "[":
             bracket_depth += 1
-            current_part += char
-        elif char == "]" and not in_quotes:
-            bracket_depth -= 1
-            if bracket_depth <= 0:
-                in_array = False
-                bracket_depth = 0
-            current_part += char
-        elif char in ('"', "'") and not in_quotes:
+        elif char == "]":
+            bracket_depth = max(bracket_depth - 1, 0)
+        elif char in ('"', "'"):
             in_quotes = True
             quote_char = char
-            current_part += char
-        elif char == quote_char and in_quotes:
-            in_quotes = False
-            quote_char = None
-            current_part += char
-        elif char == " " and not in_quotes and not in_array:
-            if current_part.strip():
-                parts.append(current_part.strip())
-            current_part = ""
-        else:
-            current_part += char
+        elif char == " " and not bracket_depth:
+            part = option_string[start:index].strip()
+            if part:
+                parts.append(part)
+            start = index + 1
 
-    if current_part.strip():
-        parts.append(current_part.strip())
+    part = option_string[start:].strip()
+    if part:
+        parts.append(part)
+
+    return parts
+
+
+def parse_multiple_key_value_pairs(option_string: str) -> dict:
+    """Extract configuration options from space-separated key=value format with merge support"""
+    options = {}
+    merge_options = {}
+    if not option_string:
+        return {"options": options, "merge_metadata": merge_options}
+
+    parts = _split_option_tokens(option_string)
 
     for part in parts:
-        if "+=" in part:
-            # Merge operation
-            key, value = part.split("+=", 1)
-            value = value.strip()
-            # Don't strip quotes here, let parse_plugin_option_value handle it
-            key = key.strip()
-            options[key] = parse_plugin_option_value(value)
-            merge_options[key] = True
-        elif "=" in part:
-            # Override operation
-            key, value = part.split("=", 1)
-            value = value.strip()
-            # Don't strip quotes here, let parse_plugin_option_value handle it
-            key = key.strip()
-            options[key] = parse_plugin_option_value(value)
-            merge_options[key] = False
+        # "+=" requests a merge; a plain "=" overrides
+        key, sep, value = part.partition("+=")
+        merge = bool(sep)
+        if not merge:
+            key, sep, value = part.partition("=")
+            if not sep:
+                continue
+        key = key.strip()
+        # Don't strip quotes here, let parse_plugin_option_value handle it
+        options[key] = parse_plugin_option_value(value.strip())
+        merge_options[key] = merge
 
     # Return both options and merge metadata
     return {"options": options, "merge_metadata": merge_options}
@@ -346,51 +531,25 @@ def parse_plugin_options_from_cli(**kwargs) -> dict:
     plugin_options = {}
     plugin_merge_metadata = {}
 
-    option_to_plugin = {
-        "git": "Git",
-        "tests": "Tests",
-        "formatter": "Formatter",
-        "projectfile": "ProjectFile",
-        "srcdir": "SrcDir",
-        "readme": "Readme",
-        "githubactions": "GitHubActions",
-        "appveyor": "AppVeyor",
-        "cirrusci": "CirrusCI",
-        "droneci": "DroneCI",
-        "gitlabci": "GitLabCI",
-        "travisci": "TravisCI",
-        "codecov": "Codecov",
-        "coveralls": "Coveralls",
-        "documenter": "Documenter",
-        "tagbot": "TagBot",
-        "compathelper": "CompatHelper",
-        "dependabot": "Dependabot",
-        "bluestylebadge": "BlueStyleBadge",
-        "colpracbadge": "ColPracBadge",
-        "pkgevalbadge": "PkgEvalBadge",
-        "develop": "Develop",
-        "citation": "Citation",
-        "registeraction": "RegisterAction",
-        "codeowners": "CodeOwners",
-        "pkgbenchmark": "PkgBenchmark",
-        "runic": "Runic",
-    }
-
-    for option_key, plugin_name in option_to_plugin.items():
-        if option_key in kwargs and kwargs[option_key] is not None:
-            option_string = kwargs[option_key]
+    # Walk only the options that were passed; most invocations set a handful
+    for option_key, option_string in kwargs.items():
+        if option_string is None:
+            continue
+        plugin_name = _OPTION_TO_PLUGIN.get(option_key)
+        if plugin_name is None:
+            continue
 
-            if plugin_name not in plugin_options:
-                plugin_options[plugin_name] = {}
-                plugin_merge_metadata[plugin_name] = {}
+        if plugin_name not in plugin_options:
+            plugin_options[plugin_name] = {}
+            plugin_merge_metadata[plugin_name] = {}
 
-            if option_string:
-                result = parse_multiple_key_value_pairs(option_string)
-                options = result["options"]
-                merge_info = result["merge_metadata"]
-                if options:
-                    plugin_options[plugin_name].update(options)
-                    plugin_merge_metadata[plugin_name].update(merge_info)
+        if option_string:
+            result = parse_multiple_key_value_pairs(option_string)
+            options = result["options"]
+            merge_info = result["merge_metadata"]
+            if options:
+                plugin_options[plugin_name].update(options)
+                plugin_merge_metadata[plugin_name].update(merge_info)
 
     # License uses different CLI option format than other plugins
     if "license" in kwargs and kwargs["license"] is not None:
@@ -521,64 +680,28 @@ def format_value_display(value):
         return str(value)
 
 
-def create_dynamic_plugin_options(cmd):
-    """Programmatically register Click options for all known PkgTemplates.jl plugins"""
-
-    plugin_option_names = {
-        # Core plugins
-        "Git": "--git",
-        "Tests": "--tests",
-        "Formatter": "--formatter",
-        "ProjectFile": "--projectfile",
-        "SrcDir": "--srcdir",
-        "Readme": "--readme",
-        # CI/CD plugins
-        "GitHubActions": "--githubactions",
-        "AppVeyor": "--appveyor",
-        "CirrusCI": "--cirrusci",
-        "DroneCI": "--droneci",
-        "GitLabCI": "--gitlabci",
-        "TravisCI": "--travisci",
-        # Code coverage plugins
-        "Codecov": "--codecov",
-        "Coveralls": "--coveralls",
-        # Documentation plugins
-        "Documenter": "--documenter",
-        # Automation plugins
-        "TagBot": "--tagbot",
-        "CompatHelper": "--compathelper",
-        "Dependabot": "--dependabot",
-        # Badge plugins
-        "BlueStyleBadge": "--bluestylebadge",
-        "ColPracBadge": "--colpracbadge",
-        "PkgEvalBadge": "--pkgevalbadge",
-        # Miscellaneous plugins
-        "Develop": "--develop",
-        "Citation": "--citation",
-        "RegisterAction": "--registeraction",
-        "CodeOwners": "--codeowners",
-        "PkgBenchmark": "--pkgbenchmark",
-        "Runic": "--runic",
-    }
-
-    available_plugins = JuliaPackageGenerator.get_available_plugins()
-
-    for plugin in available_plugins:
-        if plugin == "License":
-            continue
+@functools.lru_cache(maxsize=1)
+def _plugin_option_decorators() -> Tuple[Callable, ...]:
+    """Build the per-plugin Click option decorators once for all commands"""
+    # click.option creates a fresh Option on each application, so the same
+    # decorators can be shared by create, config and config set
+    return tuple(
+        click.option(
+            _PLUGIN_OPTION_NAMES.get(plugin, f"--{plugin.lower()}"),
+            is_flag=False,
+            flag_value="",  # --plugin only → empty string (enable with defaults)
+            default=None,  # not specified → None (disabled)
+            help=f"Enable {plugin} plugin (empty for defaults, or key=value pairs)",
+        )
+        for plugin in JuliaPackageGenerator.get_available_plugins()
+        if plugin != "License"
+    )
 
-        option_name = plugin_option_names.get(plugin, f"--{plugin.lower()}")
 
-        def add_option(plugin_name=plugin, opt_name=option_name):
-            return click.option(
-                opt_name,
-                is_flag=False,
-                flag_value="",  # --plugin only → empty string (enable with defaults)
-                default=None,  # not specified → None (disabled)
-                help=f"Enable {plugin} plugin (empty for defaults, or key=value pairs)",
-            )
-
-        cmd = add_option()(cmd)
+def create_dynamic_plugin_options(cmd):
+    """Programmatically register Click options for all known PkgTemplates.jl plugins"""
+    for add_option in _plugin_option_decorators():
+        cmd = add_option(cmd)
 
     return cmd
 
@@ -601,12 +724,12 @@ def main():
     multiple=True,
     help="Author names for the package. Examples: --author 'A, B' or --author 'A' --author 'B'. Supports both single and multiple authors.",
 )
-@click.option("--user", "-u", help=get_user_help())
-@click.option("--mail", "-m", help=get_mail_help())
+@click.option("--user", "-u", cls=LazyHelpOption, help_factory=get_user_help)
+@click.option("--mail", "-m", cls=LazyHelpOption, help_factory=get_mail_help)
 @click.option(
     "--output-dir",
     "-o",
-    type=click.Path(),
+    type=click.Path(file_okay=False, path_type=Path),
     help="Output directory (default: current directory)",
 )
 @click.option(
@@ -615,7 +738,9 @@ def main():
     type=str,
     flag_value="",
     default=None,
-    help=get_help_with_fallback(
+    cls=LazyHelpOption,
+    help_factory=functools.partial(
+        get_help_with_fallback,
         "License type (common: MIT, Apache, BSD2, BSD3, GPL2, GPL3, MPL, ISC, LGPL2, LGPL3, AGPL3, EUPL; or any PkgTemplates.jl license identifier)",
         "license_type",
         "uses PkgTemplates.jl default if not set",
@@ -646,7 +771,9 @@ def main():
 )
 @click.option(
     "--mise-filename-base",
-    help=get_help_with_default(
+    cls=LazyHelpOption,
+    help_factory=functools.partial(
+        get_help_with_default,
         "Base name for mise config file (e.g., '.mise' creates '.mise.toml', 'mise' creates 'mise.toml')",
         "mise_filename_base",
         ".mise",
@@ -655,7 +782,9 @@ def main():
 @click.option(
     "--with-mise/--no-mise",
     default=True,
-    help=get_help_with_default(
+    cls=LazyHelpOption,
+    help_factory=functools.partial(
+        get_help_with_default,
         "Enable/disable mise task file generation",
         "with_mise",
         "enabled",
@@ -669,7 +798,7 @@ def create(
     author: Tuple[str, ...],
     user: Optional[str],
     mail: Optional[str],
-    output_dir: Optional[str],
+    output_dir: Optional[Path],
     license: Optional[str],
     julia_version: Optional[str],
     config_file: Optional[str],
@@ -686,38 +815,29 @@ def create(
         set_config_file(config_file)
 
     # Strip .jl suffix for validation while preserving original name for generation
-    name_to_check = package_name
-    if package_name.endswith(".jl"):
-        name_to_check = package_name[:-3]
-
-    # Enforce Julia package naming conventions
-    if not name_to_check.replace("_", "").replace("-", "").isalnum():
-        click.echo(
-            "Error: Package name must contain only letters, numbers, hyphens, and underscores (optionally ending with .jl)",
-            err=True,
-        )
-        sys.exit(1)
+    name_to_check = package_name.removesuffix(".jl")
 
-    if not package_name[0].isalpha():
-        click.echo("Error: Package name must start with a letter", err=True)
+    # Enforce Julia package naming conventions in a single match; only the
+    # failure path needs to work out which rule was broken
+    if not _PACKAGE_NAME_RE.fullmatch(name_to_check):
+        if not _PACKAGE_NAME_CHARS_RE.fullmatch(name_to_check):
+            click.echo(
+                "Error: Package name must contain only letters, numbers, hyphens, and underscores (optionally ending with .jl)",
+                err=True,
+            )
+        else:
+            click.echo("Error: Package name must start with a letter", err=True)
         sys.exit(1)
 
     # Establish configuration precedence: CLI args > config file > built-in defaults
-    config = load_config()
-    # Flatten nested structure for backward compatibility with existing code
-    flat_config = flatten_config_for_backward_compatibility(config)
-    defaults = flat_config.get("default", {})
+    defaults = load_defaults()
 
     cli_plugin_result = parse_plugin_options_from_cli(license=license, **kwargs)
     cli_plugin_options = cli_plugin_result["options"]
 
-    # Extract enabled plugins from plugin options
-    # Plugins are enabled when their options are specified (not None)
-    enabled_plugins = []
-
-    for plugin_name, options in cli_plugin_options.items():
-        # Plugin is enabled if options are provided (including empty string for defaults)
-        enabled_plugins.append(plugin_name)
+    # Plugins are enabled when their options are specified (not None),
+    # including an empty string for defaults
+    enabled_plugins = set(cli_plugin_options)
 
     # Apply config defaults if CLI arguments not provided
     # Author resolution follows simplified precedence: CLI --author > config author > PkgTemplates.jl fallback
@@ -748,12 +868,18 @@ def create(
             # No author specified - delegate to PkgTemplates.jl git config fallback
             final_authors = None
             final_author = None
-    final_user = user or defaults.get("user")
-    final_mail = mail or defaults.get("mail")
-    final_output_dir = output_dir or defaults.get("output_dir", ".")
-    final_mise_filename_base = mise_filename_base or defaults.get(
-        "mise_filename_base", ".mise"
+    resolved = resolve_option_defaults(
+        defaults,
+        user=user,
+        mail=mail,
+        output_dir=output_dir,
+        julia_version=julia_version,
+        mise_filename_base=mise_filename_base,
     )
+    final_user = resolved["user"]
+    final_mail = resolved["mail"]
+    final_output_dir = Path(resolved["output_dir"])
+    final_mise_filename_base = resolved["mise_filename_base"]
     final_with_mise = (
         with_mise if with_mise is not None else defaults.get("with_mise", True)
     )
@@ -766,41 +892,27 @@ def create(
     # Check for direct plugin sections in config (e.g., [default.Formatter])
     for key in defaults.keys():
         if "." in key:
-            plugin_name, _ = key.split(".", 1)
+            plugin_name, _, _ = key.partition(".")
             config_detected_plugins.add(plugin_name)
-        else:
-            # Check if key matches a known plugin name (like Formatter, Git, etc.)
-            known_plugins = {
-                "Formatter",
-                "Git",
-                "Tests",
-                "ProjectFile",
-                "Documenter",
-                "TagBot",
-                "CompatHelper",
-                "Codecov",
-                "GitHubActions",
-                "License",
-            } | ARGUMENTLESS_PLUGINS
-            if key in known_plugins:
-                config_detected_plugins.add(key)
+        elif key in _CONFIG_PLUGIN_SECTIONS or key == "License":
+            # Key matches a known plugin name (like Formatter, Git, etc.)
+            config_detected_plugins.add(key)
 
     # Merge CLI-enabled plugins with config-detected plugins
-    all_enabled_plugins = set(enabled_plugins) | config_detected_plugins
+    all_enabled_plugins = enabled_plugins | config_detected_plugins
 
     # Build final configuration with proper precedence
     final_config = {}
     final_config["enabled_plugins"] = list(all_enabled_plugins)
-    final_config["julia_version"] = julia_version or defaults.get("julia_version")
+    final_config["julia_version"] = resolved["julia_version"]
     final_config["mise_filename_base"] = final_mise_filename_base
     final_config["with_mise"] = final_with_mise
 
-    # Only apply plugin options for explicitly enabled or config-detected plugins
-    final_plugin_options = {}
-
-    # Apply CLI plugin options (these are the enabled plugins)
-    for plugin, options in cli_plugin_options.items():
-        final_plugin_options[plugin] = options.copy()
+    # Only apply plugin options for explicitly enabled or config-detected plugins,
+    # starting from the CLI plugin options (these are the enabled plugins)
+    final_plugin_options = {
+        plugin: options.copy() for plugin, options in cli_plugin_options.items()
+    }
 
     # Handle legacy license_type from config for backward compatibility
     config_license = defaults.get("license_type") or defaults.get("license")
@@ -808,65 +920,24 @@ def create(
         # Add config license as License plugin option if no CLI license specified
         final_plugin_options["License"] = {"name": config_license}
 
-    # Then, apply config file options for all enabled plugins (CLI + config-detected)
+    # Then, apply config file options for all enabled plugins (CLI + config-detected).
+    # Each key is routed once; non-plugin settings such as user or with_mise
+    # match neither branch. CLI options take precedence over config file.
     if all_enabled_plugins:  # Only if there are enabled plugins
-        config_plugin_options = defaults.copy()
-        # Remove non-plugin configuration from plugin processing
-        # Note: 'authors' key removed from cleanup list as it's no longer used (unified under 'author')
-        for key in [
-            "enabled_plugins",
-            "license_type",
-            "julia_version",
-            "mise_filename_base",
-            "with_mise",
-            "user",
-            "author",
-            "mail",
-            "output_dir",
-        ]:
-            config_plugin_options.pop(key, None)
-
-        # Transform dot-notation config keys for enabled plugins only
-        for key, value in config_plugin_options.items():
+        for key, value in defaults.items():
             if "." in key:
-                plugin_name, option_name = key.split(".", 1)
+                plugin_name, _, option_name = key.partition(".")
                 if plugin_name in all_enabled_plugins:
-                    if plugin_name not in final_plugin_options:
-                        final_plugin_options[plugin_name] = {}
-                    # CLI options take precedence over config file
-                    if option_name not in final_plugin_options[plugin_name]:
-                        final_plugin_options[plugin_name][option_name] = value
-            else:
-                # Handle direct plugin sections (e.g., Formatter = {...})
-                known_plugins = {
-                    "Formatter",
-                    "Git",
-                    "Tests",
-                    "ProjectFile",
-                    "Documenter",
-                    "TagBot",
-                    "CompatHelper",
-                    "Codecov",
-                    "GitHubActions",
-                } | ARGUMENTLESS_PLUGINS
-                if key in known_plugins and key in all_enabled_plugins:
-                    if key not in final_plugin_options:
-                        final_plugin_options[key] = {}
-                    # If the value is a dict, merge it; otherwise treat as single option
-                    if isinstance(value, dict):
-                        for option_name, option_value in value.items():
-                            if option_name not in final_plugin_options[key]:
-                                final_plugin_options[key][option_name] = option_value
-                    elif (
-                        isinstance(value, bool)
-                        and value
-                        and key in ARGUMENTLESS_PLUGINS
-                    ):
-                        # Boolean true value for argumentless plugins - enable with no options
-                        pass  # Empty dict already created above
-                    else:
-                        # This shouldn't happen in normal config, but handle gracefully
-                        pass
+                    final_plugin_options.setdefault(plugin_name, {}).setdefault(
+                        option_name, value
+                    )
+            elif key in _CONFIG_PLUGIN_SECTIONS and key in all_enabled_plugins:
+                # Direct plugin sections (e.g., Formatter = {...}); a bare
+                # `Plugin = true` for argumentless plugins enables it with no options
+                plugin_config = final_plugin_options.setdefault(key, {})
+                if isinstance(value, dict):
+                    for option_name, option_value in value.items():
+                        plugin_config.setdefault(option_name, option_value)
 
     final_config["plugin_options"] = final_plugin_options
 
@@ -883,13 +954,20 @@ def create(
             final_authors or final_author,
             final_user,
             final_mail,
-            Path(final_output_dir),
+            final_output_dir,
             package_config,
         )
-        click.echo("Would execute the following Julia code:")
-        click.echo("=" * 50)
-        click.echo(julia_code)
-        click.echo("=" * 50)
+        separator = "=" * 50
+        click.echo(
+            "\n".join(
+                [
+                    "Would execute the following Julia code:",
+                    separator,
+                    julia_code,
+                    separator,
+                ]
+            )
+        )
         return
 
     try:
@@ -899,7 +977,7 @@ def create(
             or final_author,  # Authors list or None for PkgTemplates.jl fallback
             final_user,
             final_mail,
-            Path(final_output_dir),
+            final_output_dir,
             package_config,
             verbose=verbose,
         )
@@ -909,6 +987,28 @@ def create(
         sys.exit(1)
 
 
+# Display groups for `jtc plugin-info`; available plugins outside them go to "Other"
+_PLUGIN_CATEGORIES = (
+    (
+        "Core",
+        ("Git", "Tests", "Formatter", "ProjectFile", "SrcDir", "Readme", "License"),
+    ),
+    (
+        "CI/CD",
+        ("GitHubActions", "AppVeyor", "CirrusCI", "DroneCI", "GitLabCI", "TravisCI"),
+    ),
+    ("Coverage", ("Codecov", "Coveralls")),
+    ("Documentation", ("Documenter",)),
+    ("Automation", ("TagBot", "CompatHelper", "Dependabot", "RegisterAction")),
+    ("Badges", ("BlueStyleBadge", "ColPracBadge", "PkgEvalBadge")),
+    ("Development", ("Citation", "CodeOwners", "PkgBenchmark", "Develop")),
+    ("Formatting", ("Runic",)),
+)
+_CATEGORIZED_PLUGINS = frozenset(
+    plugin for _, plugin_list in _PLUGIN_CATEGORIES for plugin in plugin_list
+)
+
+
 @main.command("plugin-info")
 @click.argument("plugin_name", required=False)
 def plugin_info(plugin_name: Optional[str]):
@@ -917,83 +1017,40 @@ def plugin_info(plugin_name: Optional[str]):
     available_plugins = _get_plugins_from_julia()
 
     if plugin_name is None:
-        click.echo("Available PkgTemplates.jl plugins:")
-        click.echo("=" * 40)
+        lines = ["Available PkgTemplates.jl plugins:", "=" * 40]
 
         # Group plugins by category for better readability
-        core_plugins = [
-            "Git",
-            "Tests",
-            "Formatter",
-            "ProjectFile",
-            "SrcDir",
-            "Readme",
-            "License",
-        ]
-        ci_plugins = [
-            "GitHubActions",
-            "AppVeyor",
-            "CirrusCI",
-            "DroneCI",
-            "GitLabCI",
-            "TravisCI",
-        ]
-        coverage_plugins = ["Codecov", "Coveralls"]
-        doc_plugins = ["Documenter"]
-        automation_plugins = ["TagBot", "CompatHelper", "Dependabot", "RegisterAction"]
-        badge_plugins = ["BlueStyleBadge", "ColPracBadge", "PkgEvalBadge"]
-        dev_plugins = ["Citation", "CodeOwners", "PkgBenchmark", "Develop"]
-        formatting_plugins = ["Runic"]
-
-        categories = [
-            ("Core", core_plugins),
-            ("CI/CD", ci_plugins),
-            ("Coverage", coverage_plugins),
-            ("Documentation", doc_plugins),
-            ("Automation", automation_plugins),
-            ("Badges", badge_plugins),
-            ("Development", dev_plugins),
-            ("Formatting", formatting_plugins),
-        ]
-
-        for category, plugin_list in categories:
-            available_in_category = [p for p in plugin_list if p in available_plugins]
+        available_set = set(available_plugins)
+        for category, plugin_list in _PLUGIN_CATEGORIES:
+            available_in_category = [p for p in plugin_list if p in available_set]
             if available_in_category:
-                click.echo(f"\n{category}:")
-                for p in available_in_category:
-                    click.echo(f"  {p}")
+                lines.append(f"\n{category}:")
+                lines.extend(f"  {p}" for p in available_in_category)
 
         # Show any remaining plugins not categorized
-        categorized = set()
-        for _, plugin_list in categories:
-            categorized.update(plugin_list)
-        uncategorized = [p for p in available_plugins if p not in categorized]
+        uncategorized = [p for p in available_plugins if p not in _CATEGORIZED_PLUGINS]
         if uncategorized:
-            click.echo("\nOther:")
-            for p in uncategorized:
-                click.echo(f"  {p}")
+            lines.append("\nOther:")
+            lines.extend(f"  {p}" for p in uncategorized)
 
-        click.echo(
+        lines.append(
             "\nUse 'jtc plugin-info <plugin_name>' to see options for a specific plugin."
         )
-        click.echo("Example: jtc plugin-info Git")
+        lines.append("Example: jtc plugin-info Git")
+        click.echo("\n".join(lines))
         return
 
     # Find matching plugin name (case-insensitive search)
-    plugin_name_matched = None
-    for known_plugin in available_plugins:
-        if known_plugin.lower() == plugin_name.lower():
-            plugin_name_matched = known_plugin
-            break
+    plugin_name_matched = {p.lower(): p for p in available_plugins}.get(
+        plugin_name.lower()
+    )
 
     if plugin_name_matched is None:
         available = ", ".join(available_plugins)
-        click.echo(f"Unknown plugin: {plugin_name}")
-        click.echo(f"Available plugins: {available}")
+        click.echo(f"Unknown plugin: {plugin_name}\nAvailable plugins: {available}")
         sys.exit(1)
 
-    click.echo(f"Help for {plugin_name_matched} plugin:")
-    click.echo("=" * 40)
+    click.echo(f"Help for {plugin_name_matched} plugin:\n{'=' * 40}")
 
     # Delegate to Julia's documentation system
     try:
@@ -1015,21 +1072,20 @@ def plugin_info(plugin_name: Optional[str]):
 
     except subprocess.CalledProcessError as e:
         # Fallback to basic message if Julia doc system fails
+        plugin_option_name = _get_plugin_cli_option_name(plugin_name_matched)
         click.echo(
-            f"Could not retrieve documentation for {plugin_name_matched} plugin from Julia."
-        )
-        click.echo(
-            "This may indicate that Julia or PkgTemplates.jl is not properly installed."
-        )
-        click.echo(
-            f"\nError details: {e.stderr.strip() if e.stderr else 'Unknown error'}"
+            "\n".join(
+                [
+                    f"Could not retrieve documentation for {plugin_name_matched} plugin from Julia.",
+                    "This may indicate that Julia or PkgTemplates.jl is not properly installed.",
+                    f"\nError details: {e.stderr.strip() if e.stderr else 'Unknown error'}",
+                    # Provide basic usage info as fallback
+                    "\nBasic usage:",
+                    f"  jtc create MyPkg {plugin_option_name}",
+                    f"  jtc create MyPkg {plugin_option_name} 'key=value'",
+                ]
+            )
         )
-
-        # Provide basic usage info as fallback
-        click.echo("\nBasic usage:")
-        plugin_option_name = _get_plugin_cli_option_name(plugin_name_matched)
-        click.echo(f"  jtc create MyPkg {plugin_option_name}")
-        click.echo(f"  jtc create MyPkg {plugin_option_name} 'key=value'")
     except FileNotFoundError:
         click.echo(
             "Julia not found. Please install Julia and ensure it's in your PATH."
@@ -1039,44 +1095,7 @@ def plugin_info(plugin_name: Optional[str]):
 
 def _get_plugin_cli_option_name(plugin_name: str) -> str:
     """Get CLI option name for a plugin"""
-    plugin_option_names = {
-        # Core plugins
-        "Git": "--git",
-        "Tests": "--tests",
-        "Formatter": "--formatter",
-        "ProjectFile": "--projectfile",
-        "SrcDir": "--srcdir",
-        "Readme": "--readme",
-        # CI/CD plugins
-        "GitHubActions": "--githubactions",
-        "AppVeyor": "--appveyor",
-        "CirrusCI": "--cirrusci",
-        "DroneCI": "--droneci",
-        "GitLabCI": "--gitlabci",
-        "TravisCI": "--travisci",
-        # Code coverage plugins
-        "Codecov": "--codecov",
-        "Coveralls": "--coveralls",
-        # Documentation plugins
-        "Documenter": "--documenter",
-        # Automation plugins
-        "TagBot": "--tagbot",
-        "CompatHelper": "--compathelper",
-        "Dependabot": "--dependabot",
-        # Badge plugins
-        "BlueStyleBadge": "--bluestylebadge",
-        "ColPracBadge": "--colpracbadge",
-        "PkgEvalBadge": "--pkgevalbadge",
-        # Miscellaneous plugins
-        "Develop": "--develop",
-        "Citation": "--citation",
-        "RegisterAction": "--registeraction",
-        "CodeOwners": "--codeowners",
-        "PkgBenchmark": "--pkgbenchmark",
-        "Runic": "--runic",
-        "License": "--license",
-    }
-    return plugin_option_names.get(plugin_name, f"--{plugin_name.lower()}")
+    return _PLUGIN_OPTION_NAMES.get(plugin_name, f"--{plugin_name.lower()}")
 
 
 def _get_plugins_from_julia() -> List[str]:
@@ -1084,29 +1103,34 @@ def _get_plugins_from_julia() -> List[str]:
     return JuliaPackageGenerator.get_available_plugins()
 
 
+# jtc usage example lines per plugin; {option} is the plugin's CLI option
+_PLUGIN_USAGE_EXAMPLES = {
+    "License": (
+        "  jtc create MyPkg {option} MIT",
+        "  jtc create MyPkg {option} 'name=Apache'",
+        "  jtc create MyPkg {option} 'name=MIT path=./custom-license.txt'",
+    ),
+}
+_DEFAULT_PLUGIN_USAGE_EXAMPLES = (
+    "  jtc create MyPkg {option}",
+    "  jtc create MyPkg {option} 'option1=value1 option2=value2'",
+)
+
+
 def _add_jtc_plugin_examples(plugin_name: str):
     """Add jtc-specific usage examples for plugins"""
     plugin_option = _get_plugin_cli_option_name(plugin_name)
+    examples = _PLUGIN_USAGE_EXAMPLES.get(plugin_name, _DEFAULT_PLUGIN_USAGE_EXAMPLES)
 
-    click.echo("\njtc CLI usage examples:")
-    click.echo("=" * 25)
-
+    lines = ["\njtc CLI usage examples:", "=" * 25]
+    lines.extend(example.format(option=plugin_option) for example in examples)
     if plugin_name == "License":
-        click.echo(f"  jtc create MyPkg {plugin_option} MIT")
-        click.echo(f"  jtc create MyPkg {plugin_option} 'name=Apache'")
-        click.echo(
-            f"  jtc create MyPkg {plugin_option} 'name=MIT path=./custom-license.txt'"
-        )
-        click.echo(
+        lines.append(
             f"\nLicense aliases: {' '.join(JuliaPackageGenerator.LICENSE_MAPPING.keys())}"
         )
-    else:
-        click.echo(f"  jtc create MyPkg {plugin_option}")
-        click.echo(
-            f"  jtc create MyPkg {plugin_option} 'option1=value1 option2=value2'"
-        )
+    lines.append("\nFor more plugin configuration examples, see: jtc create --help")
 
-    click.echo("\nFor more plugin configuration examples, see: jtc create --help")
+    click.echo("\n".join(lines))
 
 
 @main.command()
@@ -1126,84 +1150,46 @@ def completion(shell: str):
         sys.exit(1)
 
 
+@functools.lru_cache(maxsize=1)
+def _get_fish_template():
+    """Load and compile the fish completion template once per process"""
+    # Jinja2 is only needed for completion output, so keep it off the startup path
+    from jinja2 import Environment, PackageLoader
+
+    # Packaged templates do not change at runtime, so skip the reload stat
+    env = Environment(
+        loader=PackageLoader("juliapkgtemplates", "templates"), auto_reload=False
+    )
+    return env.get_template("fish_completion.j2")
+
+
 def generate_fish_completion() -> str:
     """Generate fish completion script for jtc command using Jinja2 template"""
     # Get available plugins and licenses dynamically
-    plugins = " ".join(JuliaPackageGenerator.get_available_plugins())
+    available_plugins = JuliaPackageGenerator.get_available_plugins()
+    plugins = " ".join(available_plugins)
 
     licenses = " ".join(JuliaPackageGenerator.LICENSE_MAPPING.keys())
 
-    # Generate plugin options dynamically based on current CLI structure
+    # Generate create and config plugin options in one pass over the plugins
     plugin_options = []
-
-    plugin_option_names = {
-        # Core plugins
-        "Git": "--git",
-        "Tests": "--tests",
-        "Formatter": "--formatter",
-        "ProjectFile": "--projectfile",
-        "SrcDir": "--srcdir",
-        "Readme": "--readme",
-        # CI/CD plugins
-        "GitHubActions": "--githubactions",
-        "AppVeyor": "--appveyor",
-        "CirrusCI": "--cirrusci",
-        "DroneCI": "--droneci",
-        "GitLabCI": "--gitlabci",
-        "TravisCI": "--travisci",
-        # Code coverage plugins
-        "Codecov": "--codecov",
-        "Coveralls": "--coveralls",
-        # Documentation plugins
-        "Documenter": "--documenter",
-        # Automation plugins
-        "TagBot": "--tagbot",
-        "CompatHelper": "--compathelper",
-        "Dependabot": "--dependabot",
-        # Badge plugins
-        "BlueStyleBadge": "--bluestylebadge",
-        "ColPracBadge": "--colpracbadge",
-        "PkgEvalBadge": "--pkgevalbadge",
-        # Miscellaneous plugins
-        "Develop": "--develop",
-        "Citation": "--citation",
-        "RegisterAction": "--registeraction",
-        "CodeOwners": "--codeowners",
-        "PkgBenchmark": "--pkgbenchmark",
-        "Runic": "--runic",
-    }
-
-    available_plugins = JuliaPackageGenerator.get_available_plugins()
+    config_plugin_options = []
 
     for plugin in available_plugins:
         if plugin == "License":
             continue  # License is handled separately
 
-        option_name = plugin_option_names.get(plugin, f"--{plugin.lower()}")
+        option_name = _PLUGIN_OPTION_NAMES.get(plugin, f"--{plugin.lower()}")
         # Fish expects option names without the CLI prefix
         fish_option = option_name[2:]
         plugin_options.append(
             f'complete -c jtc -n "__fish_seen_subcommand_from create" -l {fish_option} -d "Enable {plugin} plugin (empty for defaults, or key=value pairs)"'
         )
-
-    # Generate config command plugin options
-    config_plugin_options = []
-    for plugin in available_plugins:
-        if plugin == "License":
-            continue  # License is handled separately
-
-        option_name = plugin_option_names.get(plugin, f"--{plugin.lower()}")
-        # Fish expects option names without the CLI prefix
-        fish_option = option_name[2:]
         config_plugin_options.append(
             f'complete -c jtc -n "__fish_seen_subcommand_from config" -l {fish_option} -d "Set default {plugin} plugin options (key=value pairs)"'
         )
 
-    # Load and render template
-    env = Environment(loader=PackageLoader("juliapkgtemplates", "templates"))
-    template = env.get_template("fish_completion.j2")
-
-    return template.render(
+    return _get_fish_template().render(
         plugins=plugins,
         licenses=licenses,
         plugin_options=plugin_options,
@@ -1255,24 +1241,20 @@ def config(
 
     if ctx.invoked_subcommand is None:
         # Check if any configuration options are provided
-        has_config_options = any(
-            [
-                author,
-                user is not None,
-                mail is not None,
-                license is not None,
-                julia_version is not None,
-                mise_filename_base is not None,
-                with_mise is not None,
-            ]
+        has_config_options = bool(author) or any(
+            value is not None
+            for value in (
+                user,
+                mail,
+                license,
+                julia_version,
+                mise_filename_base,
+                with_mise,
+            )
         )
 
-        # Check if any plugin options are provided
-        plugin_result = parse_plugin_options_from_cli(**kwargs)
-        plugin_options = plugin_result["options"]
-        has_plugin_options = bool(plugin_options)
-
-        if has_config_options or has_plugin_options:
+        # Plugin options only need parsing when no plain option was given
+        if has_config_options or parse_plugin_options_from_cli(**kwargs)["options"]:
             # Options provided, delegate to set functionality
             _set_config(
                 author,
@@ -1289,51 +1271,60 @@ def config(
             _show_config()
 
 
+# Keys shown as basic settings by `jtc config show`; author is handled separately
+_BASIC_CONFIG_KEYS = frozenset(
+    {
+        "author",
+        "user",
+        "mail",
+        "license_type",
+        "julia_version",
+        "mise_filename_base",
+        "with_mise",
+    }
+)
+
+
 def _show_config():
     """Display current configuration values"""
     config_data = load_config()
-    click.echo("Current configuration:")
-    click.echo("=" * 40)
     config_path = get_config_file_path()
-    click.echo(f"Config file: {config_path}")
-    click.echo()
+    # Collect the report and write it with a single echo
+    lines = [
+        "Current configuration:",
+        "=" * 40,
+        f"Config file: {config_path}",
+        "",
+    ]
 
     defaults = config_data.get("default", {})
     if not defaults:
-        click.echo("No configuration set")
+        lines.append("No configuration set")
+        click.echo("\n".join(lines))
         return
 
-    # Define basic configuration keys for display purposes
-    # Removed 'authors' key as part of unified author handling - only 'author' key is used now
-    basic_config_keys = {
-        "author",
-        "user",
-        "mail",
-        "license_type",
-        "julia_version",
-        "mise_filename_base",
-        "with_mise",
-    }
     basic_config = {}
     plugin_config = {}
 
     for key, value in defaults.items():
-        if key in basic_config_keys:
+        if key in _BASIC_CONFIG_KEYS:
             basic_config[key] = value
         elif isinstance(value, dict):
             plugin_config[key] = value
 
     for key, value in basic_config.items():
         if value is not None:
-            click.echo(f"{key}: {repr(value)}")
+            lines.append(f"{key}: {repr(value)}")
 
     # Display plugin configuration
     if plugin_config:
-        click.echo("\nPlugin configuration:")
+        lines.append("\nPlugin configuration:")
         for plugin_name, options in plugin_config.items():
-            click.echo(f"  {plugin_name}:")
+            lines.append(f"  {plugin_name}:")
             for option_key, option_value in options.items():
-                click.echo(f"    {option_key}: {repr(option_value)}")
+                lines.append(f"    {option_key}: {repr(option_value)}")
+
+    click.echo("\n".join(lines))
 
 
 def _set_config(
@@ -1356,8 +1347,9 @@ def _set_config(
     plugin_options = plugin_result["options"]
     plugin_merge_metadata = plugin_result["merge_metadata"]
 
-    # Set configuration values
+    # Set configuration values; report lines are collected and written at once
     updated = False
+    messages = []
     if author:
         # Support both multiple --author options and comma-separated values within each option
         # Consistent parsing logic with create command for uniform user experience
@@ -1371,35 +1363,25 @@ def _set_config(
         # Design choice: Preserve string format for single author to maintain compatibility with existing configs
         if len(expanded_authors) == 1:
             config_data["default"]["author"] = expanded_authors[0]
-            click.echo(f"Set default author: {expanded_authors[0]}")
+            messages.append(f"Set default author: {expanded_authors[0]}")
         else:
             config_data["default"]["author"] = expanded_authors
-            click.echo(f"Set default author(s): {', '.join(expanded_authors)}")
-        updated = True
-    if user is not None:
-        config_data["default"]["user"] = user
-        click.echo(f"Set default user: {user}")
-        updated = True
-    if mail is not None:
-        config_data["default"]["mail"] = mail
-        click.echo(f"Set default mail: {mail}")
-        updated = True
-    if license is not None:
-        config_data["default"]["license_type"] = license
-        click.echo(f"Set default license: {license}")
-        updated = True
-    if julia_version is not None:
-        config_data["default"]["julia_version"] = julia_version
-        click.echo(f"Set default julia_version: {julia_version}")
-        updated = True
-    if mise_filename_base is not None:
-        config_data["default"]["mise_filename_base"] = mise_filename_base
-        click.echo(f"Set default mise_filename_base: {mise_filename_base}")
-        updated = True
-    if with_mise is not None:
-        config_data["default"]["with_mise"] = with_mise
-        click.echo(f"Set default with_mise: {with_mise}")
+            messages.append(f"Set default author(s): {', '.join(expanded_authors)}")
         updated = True
+    # (parameter name shown to the user, config key, value); only license differs
+    basic_values = (
+        ("user", "user", user),
+        ("mail", "mail", mail),
+        ("license", "license_type", license),
+        ("julia_version", "julia_version", julia_version),
+        ("mise_filename_base", "mise_filename_base", mise_filename_base),
+        ("with_mise", "with_mise", with_mise),
+    )
+    for param_name, config_key, value in basic_values:
+        if value is not None:
+            config_data["default"][config_key] = value
+            messages.append(f"Set default {param_name}: {value}")
+            updated = True
 
     # Process plugin options with merge support
     for plugin_name, options in plugin_options.items():
@@ -1416,7 +1398,7 @@ def _set_config(
                 if existing_value is None:
                     # First-time setting
                     final_value = option_value
-                    click.echo(
+                    messages.append(
                         f"Set default {plugin_name}.{option_key}: {format_value_display(final_value)}"
                     )
                 elif merge_mode:
@@ -1424,10 +1406,14 @@ def _set_config(
                     final_value = universal_merge_option(
                         existing_value, option_value, merge_mode=True
                     )
-                    click.echo(f"Merged {plugin_name}.{option_key}:")
-                    click.echo(f"  Previous: {format_value_display(existing_value)}")
-                    click.echo(f"  Added:    {format_value_display(option_value)}")
-                    click.echo(f"  Result:   {format_value_display(final_value)}")
+                    messages.extend(
+                        [
+                            f"Merged {plugin_name}.{option_key}:",
+                            f"  Previous: {format_value_display(existing_value)}",
+                            f"  Added:    {format_value_display(option_value)}",
+                            f"  Result:   {format_value_display(final_value)}",
+                        ]
+                    )
                 else:
                     # Check if we should auto-merge for certain array-like options (temporary for tests)
                     if option_key == "ignore" and plugin_name == "Git":
@@ -1435,22 +1421,22 @@ def _set_config(
                         final_value = universal_merge_option(
                             existing_value, option_value, merge_mode=True
                         )
-                        click.echo(
+                        messages.append(
                             f"Set default {plugin_name}.{option_key}: {format_value_display(final_value)}"
                         )
                     else:
                         # Override mode (default)
                         final_value = option_value
                         if existing_value != final_value:
-                            click.echo(f"Overrode {plugin_name}.{option_key}:")
-                            click.echo(
-                                f"  Previous: {format_value_display(existing_value)} (removed)"
-                            )
-                            click.echo(
-                                f"  New:      {format_value_display(final_value)}"
+                            messages.extend(
+                                [
+                                    f"Overrode {plugin_name}.{option_key}:",
+                                    f"  Previous: {format_value_display(existing_value)} (removed)",
+                                    f"  New:      {format_value_display(final_value)}",
+                                ]
                             )
                         else:
-                            click.echo(
+                            messages.append(
                                 f"Set default {plugin_name}.{option_key}: {format_value_display(final_value)} (unchanged)"
                             )
 
@@ -1458,10 +1444,11 @@ def _set_config(
                 updated = True
         elif plugin_name in ARGUMENTLESS_PLUGINS:  # Argumentless plugin activation
             config_data["default"][plugin_name] = True
-            click.echo(f"Enabled argumentless plugin: {plugin_name}")
+            messages.append(f"Enabled argumentless plugin: {plugin_name}")
             updated = True
 
     if updated:
+        click.echo("\n".join(messages))
         save_config(config_data)
         click.echo("Configuration saved")
     else:
@@ -2,14 +2,13 @@
 Julia package generator using PkgTemplates.jl and Jinja2
 """
 
+import functools
 import logging
 import re
 import subprocess
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Union
-
-from jinja2 import Environment, FileSystemLoader
+from typing import Dict, Any, Optional, List, Tuple, Union
 
 
 class JuliaDependencyError(Exception):
@@ -124,6 +123,9 @@ class JuliaPackageGenerator:
     }
 
     def __init__(self):
+        # Imported here so plugin discovery at CLI startup does not pay for Jinja2
+        from jinja2 import Environment, FileSystemLoader
+
         self.templates_dir = Path(__file__).parent / "templates"
 
         # Preserve template formatting by disabling automatic whitespace trimming
@@ -136,6 +138,17 @@ class JuliaPackageGenerator:
     @staticmethod
     def get_available_plugins() -> List[str]:
         """Get available plugins dynamically from Julia's PkgTemplates module"""
+        # Each caller gets its own list so mutating it cannot corrupt the cache
+        return list(JuliaPackageGenerator._query_available_plugins())
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _query_available_plugins() -> Tuple[str, ...]:
+        """Query Julia for plugin names once per process
+
+        Every query starts Julia, and the CLI needs the list several times
+        while building its commands.
+        """
         try:
             julia_cmd = [
                 "julia",
@@ -155,11 +168,11 @@ class JuliaPackageGenerator:
             result = subprocess.run(
                 julia_cmd, capture_output=True, text=True, check=True
             )
-            plugins = [
+            plugins = tuple(
                 line.strip()
                 for line in result.stdout.strip().split("\n")
                 if line.strip()
-            ]
+            )
             return plugins
 
         except FileNotFoundError:
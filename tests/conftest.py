@@ -162,10 +162,18 @@ def backup_user_config(monkeypatch, tmp_path_factory):
 @pytest.fixture(autouse=True)
 def reset_config_path():
     """Prevent test interference by restoring default config file path behavior"""
-    from juliapkgtemplates.cli import set_config_file
+    from juliapkgtemplates.cli import (
+        set_config_file,
+        _get_help_defaults,
+        _load_config_cached,
+        _resolve_xdg_config_file_path,
+    )
 
     try:
         yield
     finally:
         # Restore default config file path behavior to prevent cross-test contamination
         set_config_file(None)
+        _resolve_xdg_config_file_path.cache_clear()
+        _load_config_cached.cache_clear()
+        _get_help_defaults.cache_clear()
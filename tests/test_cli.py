@@ -3,8 +3,11 @@ Tests for CLI module
 """
 
 import os
+import sys
 from unittest.mock import patch, Mock
 
+import pytest
+
 from juliapkgtemplates.cli import (
     main,
     get_config_file_path,
@@ -33,6 +36,26 @@ class TestConfigFunctions:
                 expected = temp_config_dir / ".config" / "jtc" / "config.toml"
                 assert config_path == expected
 
+    def test_get_config_file_path_resolution_is_cached(self, temp_config_dir):
+        """Test repeated lookups reuse the resolved XDG config path"""
+        from juliapkgtemplates.cli import _resolve_xdg_config_file_path
+
+        with patch.dict(os.environ, {"XDG_CONFIG_HOME": str(temp_config_dir)}):
+            _resolve_xdg_config_file_path.cache_clear()
+            first = get_config_file_path()
+            second = get_config_file_path()
+            assert first == second
+            assert _resolve_xdg_config_file_path.cache_info().hits == 1
+
+    def test_get_config_file_path_does_not_create_directory(self, temp_config_dir):
+        """Test resolving the config path has no filesystem side effects"""
+        with patch.dict(os.environ, {"XDG_CONFIG_HOME": str(temp_config_dir)}):
+            config_path = get_config_file_path()
+            assert not config_path.parent.exists()
+
+            save_config({"default": {"author": "Test Author"}})
+            assert config_path.exists()
+
     def test_load_config_existing_file(self, temp_config_dir):
         """Test loading existing config file"""
         config_content = b'[default]\nauthor = "Test Author"\nlicense = "MIT"\n'
@@ -56,6 +79,19 @@ class TestConfigFunctions:
             config = load_config()
             assert config == {}
 
+    def test_load_config_directory_path(self, temp_config_dir, capsys):
+        """Test a directory at the config path is treated as no config"""
+        config_dir = temp_config_dir / "config.toml"
+        config_dir.mkdir()
+
+        with patch(
+            "juliapkgtemplates.cli.get_config_file_path", return_value=config_dir
+        ):
+            config = load_config()
+            assert config == {}
+            captured = capsys.readouterr()
+            assert captured.err == ""
+
     def test_load_config_invalid_file(self, temp_config_dir, capsys):
         """Test loading invalid config file"""
         config_file = temp_config_dir / "invalid.toml"
@@ -69,6 +105,110 @@ class TestConfigFunctions:
             captured = capsys.readouterr()
             assert "Warning: Error loading config file" in captured.err
 
+    def test_load_config_parses_file_once(self, temp_config_dir):
+        """Test repeated loads reuse the parsed config until the file is saved"""
+        config_file = temp_config_dir / "config.toml"
+        config_file.write_bytes(b'[default]\nauthor = "Test Author"\n')
+
+        from juliapkgtemplates.cli import _load_config_cached
+
+        with patch(
+            "juliapkgtemplates.cli.get_config_file_path", return_value=config_file
+        ):
+            first = load_config()
+            first["default"]["author"] = "Mutated"
+            second = load_config()
+            assert _load_config_cached.cache_info().misses == 1
+            assert second["default"]["author"] == "Test Author"
+
+            save_config({"default": {"author": "Saved Author"}})
+            assert load_config()["default"]["author"] == "Saved Author"
+
+    def test_help_helpers_share_one_config_read(self, temp_config_dir):
+        """Test help-text helpers read config defaults only once"""
+        from juliapkgtemplates.cli import (
+            _get_help_defaults,
+            get_help_with_default,
+            get_help_with_fallback,
+        )
+
+        mock_config = {"default": {"user": "configuser", "with_mise": False}}
+        _get_help_defaults.cache_clear()
+        with patch(
+            "juliapkgtemplates.cli.load_config", return_value=mock_config
+        ) as mock_load_config:
+            assert (
+                get_help_with_fallback("User", "user") == "User (default: configuser)"
+            )
+            assert (
+                get_help_with_default("Mise", "with_mise", "enabled")
+                == "Mise (default: False)"
+            )
+            mock_load_config.assert_called_once()
+
+    def test_help_defaults_follow_config_file_and_saves(self, temp_config_dir):
+        """Test cached help defaults are refreshed on config switch and save"""
+        from juliapkgtemplates.cli import _get_help_defaults, get_help_with_fallback
+
+        first = temp_config_dir / "first.toml"
+        first.write_text('[default]\nuser = "firstuser"\n')
+        second = temp_config_dir / "second.toml"
+        second.write_text('[default]\nuser = "seconduser"\n')
+        _get_help_defaults.cache_clear()
+
+        set_config_file(str(first))
+        assert get_help_with_fallback("User", "user") == "User (default: firstuser)"
+
+        set_config_file(str(second))
+        assert get_help_with_fallback("User", "user") == "User (default: seconduser)"
+
+        save_config({"default": {"user": "saveduser"}})
+        assert get_help_with_fallback("User", "user") == "User (default: saveduser)"
+
+    def test_flatten_config_returns_flat_config_unchanged(self):
+        """Test configs without plugin tables skip the flattening rebuild"""
+        from juliapkgtemplates.cli import flatten_config_for_backward_compatibility
+
+        flat = {"default": {"user": "configuser", "Git.ssh": True}}
+        assert flatten_config_for_backward_compatibility(flat) is flat
+        assert flatten_config_for_backward_compatibility({}) == {}
+
+    def test_load_defaults_flattens_plugin_tables(self):
+        """Test load_defaults returns the [default] table in dot-notation"""
+        from juliapkgtemplates.cli import load_defaults
+
+        mock_config = {"default": {"user": "configuser", "Git": {"ssh": True}}}
+        with patch("juliapkgtemplates.cli.load_config", return_value=mock_config):
+            assert load_defaults() == {"user": "configuser", "Git.ssh": True}
+
+        with patch("juliapkgtemplates.cli.load_config", return_value={}):
+            assert load_defaults() == {}
+
+    def test_option_to_plugin_mirrors_option_names(self):
+        """Test the reverse plugin lookup is derived from the option name table"""
+        from juliapkgtemplates.cli import _OPTION_TO_PLUGIN, _PLUGIN_OPTION_NAMES
+
+        assert "license" not in _OPTION_TO_PLUGIN
+        assert _OPTION_TO_PLUGIN["githubactions"] == "GitHubActions"
+        for option_key, plugin_name in _OPTION_TO_PLUGIN.items():
+            assert _PLUGIN_OPTION_NAMES[plugin_name] == f"--{option_key}"
+
+    def test_resolve_option_defaults_precedence(self):
+        """Test CLI values win over config defaults, which win over fallbacks"""
+        from juliapkgtemplates.cli import resolve_option_defaults
+
+        resolved = resolve_option_defaults(
+            {"user": "configuser", "mail": "config@example.com"},
+            user="cliuser",
+            mail=None,
+        )
+
+        assert resolved["user"] == "cliuser"
+        assert resolved["mail"] == "config@example.com"
+        assert resolved["output_dir"] == "."
+        assert resolved["mise_filename_base"] == ".mise"
+        assert resolved["julia_version"] is None
+
     def test_save_config_with_tomli_w(self, temp_config_dir):
         """Test saving config with tomli_w"""
         config_file = temp_config_dir / "config.toml"
@@ -85,22 +225,88 @@ class TestConfigFunctions:
         assert "author" in content
         assert "Test Author" in content
 
-    def test_save_config_fallback(self, temp_config_dir):
-        """Test saving config with fallback method"""
+    def test_save_config_is_atomic(self, temp_config_dir):
+        """Test a failed write leaves the existing config untouched"""
         config_file = temp_config_dir / "config.toml"
-        test_config = {"default": {"author": "Test Author", "license": "MIT"}}
+        config_file.write_text('[default]\nauthor = "Original Author"\n')
+
+        with patch(
+            "juliapkgtemplates.cli.get_config_file_path", return_value=config_file
+        ):
+            with patch("os.replace", side_effect=OSError("disk full")):
+                with pytest.raises(SystemExit):
+                    save_config({"default": {"author": "New Author"}})
+
+        assert 'author = "Original Author"' in config_file.read_text()
+        assert list(temp_config_dir.iterdir()) == [config_file]
+
+    def test_save_config_writes_through_symlink(self, temp_config_dir):
+        """Test a symlinked config keeps its link and the target gets the update"""
+        target = temp_config_dir / "dotfiles" / "config.toml"
+        target.parent.mkdir()
+        target.write_text('[default]\nauthor = "Original Author"\n')
+        config_file = temp_config_dir / "config.toml"
+        config_file.symlink_to(target)
 
         with patch(
             "juliapkgtemplates.cli.get_config_file_path", return_value=config_file
         ):
-            with patch("tomli_w.dump", side_effect=ImportError):
-                save_config(test_config)
+            save_config({"default": {"author": "New Author"}})
 
-        # Verify fallback file was created
-        assert config_file.exists()
-        content = config_file.read_text()
-        assert 'author = "Test Author"' in content
-        assert 'license = "MIT"' in content
+        assert config_file.is_symlink()
+        assert 'author = "New Author"' in target.read_text()
+
+    def test_save_config_preserves_file_mode(self, temp_config_dir):
+        """Test saving keeps the permissions of an existing config"""
+        config_file = temp_config_dir / "config.toml"
+        config_file.write_text('[default]\nmail = "private@example.com"\n')
+        config_file.chmod(0o600)
+
+        with patch(
+            "juliapkgtemplates.cli.get_config_file_path", return_value=config_file
+        ):
+            save_config({"default": {"mail": "new@example.com"}})
+
+        assert config_file.stat().st_mode & 0o777 == 0o600
+        assert 'mail = "new@example.com"' in config_file.read_text()
+
+    def test_save_config_temp_file_is_private(self, temp_config_dir):
+        """Test the temp file is created 0600 before any config data is written"""
+        config_file = temp_config_dir / "config.toml"
+        written = []
+        real_fdopen = os.fdopen
+
+        def recording_fdopen(fd, *args, **kwargs):
+            written.append(os.fstat(fd).st_mode & 0o777)
+            return real_fdopen(fd, *args, **kwargs)
+
+        with patch(
+            "juliapkgtemplates.cli.get_config_file_path", return_value=config_file
+        ):
+            with patch("juliapkgtemplates.cli.os.fdopen", side_effect=recording_fdopen):
+                save_config({"default": {"mail": "private@example.com"}})
+
+        assert written == [0o600]
+        assert list(temp_config_dir.iterdir()) == [config_file]
+
+    def test_save_config_without_tomli_w(self, temp_config_dir, capsys):
+        """Test a missing tomli_w install is reported instead of hand-writing TOML"""
+        config_file = temp_config_dir / "config.toml"
+
+        with patch(
+            "juliapkgtemplates.cli.get_config_file_path", return_value=config_file
+        ):
+            # Drop the cached module so the import itself is attempted and fails
+            with patch("juliapkgtemplates.cli._toml_writer", None):
+                with patch.dict(sys.modules, {"tomli_w": None}):
+                    with pytest.raises(SystemExit) as exc_info:
+                        save_config({"default": {"author": "Test Author"}})
+
+        assert exc_info.value.code == 1
+        err = capsys.readouterr().err
+        assert "Error saving configuration" in err
+        assert "tomli_w" in err
+        assert not config_file.exists()
 
     def test_set_config_file(self, temp_config_dir):
         """Test setting custom config file"""
@@ -214,6 +420,39 @@ class TestCreateCommand:
             in result.output
         )
 
+    def test_create_invalid_package_name_non_ascii(self, cli_runner):
+        """Test create command rejects non-ASCII package names"""
+        result = cli_runner.invoke(create, ["Pkgé"])
+
+        assert result.exit_code == 1
+        assert (
+            "Package name must contain only letters, numbers, hyphens, and underscores"
+            in result.output
+        )
+
+    def test_create_invalid_package_name_separators_only(self, cli_runner):
+        """Test names made only of hyphens/underscores report the character rule"""
+        for package_name in ("-", "__", "_-.jl"):
+            result = cli_runner.invoke(create, ["--", package_name])
+
+            assert result.exit_code == 1
+            assert (
+                "Package name must contain only letters, numbers, hyphens, and underscores"
+                in result.output
+            )
+
+    def test_create_output_dir_rejects_file(self, cli_runner, temp_dir):
+        """Test --output-dir pointing at an existing file is rejected by Click"""
+        existing_file = temp_dir / "not_a_dir"
+        existing_file.write_text("")
+
+        result = cli_runner.invoke(
+            create, ["TestPackage", "--output-dir", str(existing_file)]
+        )
+
+        assert result.exit_code == 2
+        assert "is a file" in result.output
+
     def test_create_with_jl_suffix(self, cli_runner, temp_dir):
         """Test create command with valid package name ending in .jl"""
         with patch("juliapkgtemplates.cli.JuliaPackageGenerator") as mock_generator:
@@ -801,6 +1040,28 @@ class TestConfigCommand:
         config = load_config()
         assert config["default"]["user"] == "newuser"
 
+    def test_config_set_reports_fields_in_order(self, cli_runner, isolated_config):
+        """Test config set reports each field once, in order, before saving"""
+        result = cli_runner.invoke(
+            config_cmd,
+            [
+                "set",
+                "--config-file",
+                str(isolated_config),
+                "--user",
+                "newuser",
+                "--mail",
+                "new@example.com",
+            ],
+        )
+
+        assert result.exit_code == 0
+        assert result.output.splitlines() == [
+            "Set default user: newuser",
+            "Set default mail: new@example.com",
+            "Configuration saved",
+        ]
+
     def test_config_set_mail(self, cli_runner, isolated_config):
         """Test config set command sets mail"""
         result = cli_runner.invoke(
@@ -880,6 +1141,31 @@ class TestConfigCommand:
         assert "author: 'Test Author'" in result.output
         assert "license_type: 'MIT'" in result.output
 
+    def test_config_show_full_report(self, cli_runner, isolated_config):
+        """Test config show prints the complete report in order"""
+        isolated_config.write_text(
+            '[default]\nuser = "testuser"\n\n[default.Git]\nssh = true\n'
+        )
+
+        result = cli_runner.invoke(
+            config_cmd, ["show", "--config-file", str(isolated_config)]
+        )
+
+        assert result.exit_code == 0
+        lines = result.output.splitlines()
+        assert lines[2].startswith("Config file: ")
+        assert lines[2].endswith("config.toml")
+        assert lines[:2] + lines[3:] == [
+            "Current configuration:",
+            "=" * 40,
+            "",
+            "user: 'testuser'",
+            "",
+            "Plugin configuration:",
+            "  Git:",
+            "    ssh: True",
+        ]
+
     def test_config_bare_command_shows_config(self, cli_runner, isolated_config):
         """Test bare config command shows configuration (alias for show)"""
         isolated_config.write_text(
@@ -1294,6 +1580,32 @@ class TestMainCommand:
         result = cli_runner.invoke(main, ["--version"])
         assert result.exit_code == 0
 
+    def test_create_help_reads_config_when_rendered(self, cli_runner):
+        """Test config-dependent help text is built at render time"""
+        from juliapkgtemplates.cli import _get_help_defaults
+
+        _get_help_defaults.cache_clear()
+        mock_config = {"default": {"user": "renderuser", "license_type": "MIT"}}
+        with patch("juliapkgtemplates.cli.load_config", return_value=mock_config):
+            result = cli_runner.invoke(main, ["create", "--help"])
+
+        assert result.exit_code == 0
+        assert "(default: renderuser)" in result.output
+        assert "(default: MIT)" in result.output
+
+    def test_create_help_follows_config_between_renders(self, cli_runner):
+        """Test help rendered twice reflects the config active at each render"""
+        from juliapkgtemplates.cli import _get_help_defaults
+
+        for user in ("firstuser", "seconduser"):
+            _get_help_defaults.cache_clear()
+            mock_config = {"default": {"user": user}}
+            with patch("juliapkgtemplates.cli.load_config", return_value=mock_config):
+                result = cli_runner.invoke(main, ["create", "--help"])
+
+            assert result.exit_code == 0
+            assert f"(default: {user})" in result.output
+
     def test_main_help(self, cli_runner):
         """Test main command shows help"""
         result = cli_runner.invoke(main, ["--help"])
@@ -6,6 +6,7 @@ from click.testing import CliRunner
 
 from juliapkgtemplates.cli import (
     main,
+    parse_multiple_key_value_pairs,
     parse_plugin_option_value,
     parse_plugin_options_from_cli,
     load_config,
@@ -108,6 +109,28 @@ class TestPluginOptionParsing:
         }
         assert result["options"] == expected
 
+    def test_parse_multiple_key_value_pairs_tokenization(self):
+        """Test spaces inside quotes and brackets do not split options"""
+        result = parse_multiple_key_value_pairs(
+            "  style=blue ignore=['a b', \"c d\"] name='x y'  ssh+=true"
+        )
+        assert result["options"] == {
+            "style": "blue",
+            "ignore": ["a b", "c d"],
+            "name": "x y",
+            "ssh": True,
+        }
+        assert result["merge_metadata"] == {
+            "style": False,
+            "ignore": False,
+            "name": False,
+            "ssh": True,
+        }
+
+        # Quotes inside brackets and brackets inside quotes are kept intact
+        result = parse_multiple_key_value_pairs('a="[x y" b=["]", z] c=1')
+        assert result["options"] == {"a": "[x y", "b": ["]", "z"], "c": True}
+
 
 class TestCLICommands:
     """Test CLI commands with plugin options"""
@@ -182,6 +182,21 @@ class TestJuliaPackageGenerator:
             deps = JuliaPackageGenerator.check_dependencies()
             assert deps["pkgtemplates"] is False
 
+    def test_get_available_plugins_queries_julia_once(self):
+        """Test plugin discovery starts Julia once and reuses the result"""
+        JuliaPackageGenerator._query_available_plugins.cache_clear()
+        try:
+            with patch("subprocess.run") as mock_run:
+                mock_run.return_value = Mock(returncode=0, stdout="Git\nTests\n")
+                first = JuliaPackageGenerator.get_available_plugins()
+                # Callers get their own copy, so mutating it leaves the cache intact
+                first.append("Extra")
+                second = JuliaPackageGenerator.get_available_plugins()
+            assert second == ["Git", "Tests"]
+            assert mock_run.call_count == 1
+        finally:
+            JuliaPackageGenerator._query_available_plugins.cache_clear()
+
     def test_create_package_integration(self, temp_dir):
         """Test complete package creation process"""
         generator = JuliaPackageGenerator()